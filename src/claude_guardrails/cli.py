@@ -5,27 +5,38 @@ Usage:
     uvx claude-guardrails install [--all]
     uvx claude-guardrails reminders {enable,disable,list,add,remove,show,reset}
     uvx claude-guardrails progressive-disclosure {enable,disable,config}
-    uvx claude-guardrails url-discipline {enable,disable,allow,list}
+    uvx claude-guardrails url-discipline {enable,disable,status,allow,deny,list}
 """
 
-import typer
-from rich.console import Console
+import importlib
+import sys
 
-from claude_guardrails.commands import install, progressive, reminders, url_discipline
+import typer
 
 app = typer.Typer(
     name="claude-guardrails",
     help="Guardrails and hooks for Claude Code",
     no_args_is_help=True,
 )
-console = Console()
 
-# Register command groups
-app.add_typer(reminders.app, name="reminders", help="Manage periodic reminders")
-app.add_typer(
-    progressive.app, name="progressive-disclosure", help="Manage structured file nudges"
-)
-app.add_typer(url_discipline.app, name="url-discipline", help="Manage URL validation")
+# Command groups: name -> (module, help). Imported on demand by main() so that
+# e.g. `status` doesn't pay for loading every command module.
+COMMAND_GROUPS = {
+    "reminders": ("claude_guardrails.commands.reminders", "Manage periodic reminders"),
+    "progressive-disclosure": (
+        "claude_guardrails.commands.progressive",
+        "Manage structured file nudges",
+    ),
+    "url-discipline": ("claude_guardrails.commands.url_discipline", "Manage URL validation"),
+}
+
+
+def _register_subcommands(app: typer.Typer, names: list[str]) -> None:
+    """Import the given command groups and attach them to the app."""
+    for name in names:
+        module_name, help_text = COMMAND_GROUPS[name]
+        module = importlib.import_module(module_name)
+        app.add_typer(module.app, name=name, help=help_text)
 
 
 @app.command()
@@ -48,5 +59,16 @@ def status() -> None:
     show_status()
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Entry point: register only the command groups this invocation needs."""
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in COMMAND_GROUPS:
+        _register_subcommands(app, [command])
+    elif command not in ("install", "status"):
+        # --help, no args, typos: show every group
+        _register_subcommands(app, list(COMMAND_GROUPS))
     app()
+
+
+if __name__ == "__main__":
+    main()
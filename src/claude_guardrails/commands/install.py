@@ -7,43 +7,40 @@ Conflict handling:
 - If hook missing: copy normally
 """
 
+import contextlib
+import functools
 import hashlib
+import os
 import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
 
 from rich.console import Console
 from rich.table import Table
 
+from claude_guardrails import jsonio
 from claude_guardrails.paths import (
     GUARDRAILS_DIR,
     HOOKS_DIR,
+    INSTALL_CACHE,
     REMINDERS_STATE_DIR,
     ensure_dirs,
 )
-from claude_guardrails.settings import HookSpec, is_hook_registered, register_hook
-from claude_guardrails.types import CopyStatus, HookEvent
-
-console = Console()
-
-# Hook definitions
-PERIODIC_REMINDERS_HOOK = HookSpec(
-    event=HookEvent.USER_PROMPT_SUBMIT,
-    matcher=None,
-    command="~/.claude/hooks/periodic-reminders.sh",
+from claude_guardrails.settings import (
+    PERIODIC_REMINDERS_HOOK,
+    PROGRESSIVE_DISCLOSURE_HOOK,
+    URL_DISCIPLINE_HOOK,
+    is_hook_registered,
+    register_hooks,
 )
+from claude_guardrails.types import CopyStatus
 
-PROGRESSIVE_DISCLOSURE_HOOK = HookSpec(
-    event=HookEvent.PRE_TOOL_USE,
-    matcher="Read",
-    command="~/.claude/hooks/structured-file-nudge.py",
-)
+console = Console()
 
-URL_DISCIPLINE_HOOK = HookSpec(
-    event=HookEvent.PRE_TOOL_USE,
-    matcher="WebFetch",
-    command="~/.claude/hooks/webfetch-url-discipline.py",
-)
+CHUNK_SIZE = 65536  # bytes per read when comparing/hashing/copying hooks
+HOOK_MODE = 0o755  # installed hooks must be executable
 
 
 @dataclass(frozen=True)
@@ -55,6 +52,7 @@ class CopyResult:
     conflict_path: str | None = None  # Path where conflicting version was installed
 
 
+@functools.cache
 def get_bundled_hooks_dir() -> Path:
     """Get path to bundled hooks in the package."""
     import claude_guardrails.hooks as hooks_module
@@ -62,14 +60,154 @@ def get_bundled_hooks_dir() -> Path:
     return Path(hooks_module.__file__).parent
 
 
-def file_hash(path: Path) -> str:
-    """Compute short SHA256 hash of file content."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()[:6]
+@functools.cache
+def get_bundled_templates_dir() -> Path:
+    """Get path to bundled config templates in the package."""
+    import claude_guardrails.templates as templates_module
+
+    return Path(templates_module.__file__).parent
 
 
-def files_identical(path1: Path, path2: Path) -> bool:
-    """Check if two files have identical content."""
-    return path1.read_bytes() == path2.read_bytes()
+def _fast_copy(src: str | Path, dst: str | Path) -> None:
+    """
+    Copy file data and metadata (like shutil.copy2), in-kernel where possible.
+
+    shutil already uses sendfile/fcopyfile; on Linux, copy_file_range also
+    lets filesystems that support it share extents instead of copying bytes.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Unsupported by kernel/filesystem (ENOSYS, EXDEV, EINVAL...)
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _stream_compare_hash_copy(
+    src: Path, dest: Path, same_size: bool
+) -> tuple[bool, str, Path | None]:
+    """
+    Compare src against dest, hash src, and stage a copy of src in one read.
+
+    Returns (identical, short_hash, staged). `staged` is None when the files
+    are identical; otherwise it is a temp file next to dest holding src's
+    bytes, for the caller to move into place.
+    """
+    h = hashlib.blake2b(digest_size=3)
+    identical = same_size  # different sizes can't match, so dest is never read
+    staged = None
+
+    def stage() -> IO[bytes]:
+        return tempfile.NamedTemporaryFile(
+            dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp", delete=False
+        )
+
+    try:
+        if not identical:
+            staged = stage()
+        with src.open("rb") as sf, (
+            dest.open("rb") if same_size else contextlib.nullcontext()
+        ) as df:
+            while chunk := sf.read(CHUNK_SIZE):
+                h.update(chunk)
+                if identical and chunk != df.read(len(chunk)):
+                    identical = False
+                    staged = stage()
+                    # Bytes before this chunk matched dest and weren't staged yet
+                    offset = sf.tell() - len(chunk)
+                    sf.seek(0)
+                    for start in range(0, offset, CHUNK_SIZE):
+                        staged.write(sf.read(min(CHUNK_SIZE, offset - start)))
+                    sf.seek(offset + len(chunk))
+                if staged is not None:
+                    staged.write(chunk)
+    except BaseException:
+        if staged is not None:
+            staged.close()
+            os.unlink(staged.name)
+        raise
+
+    if staged is None:
+        return True, h.hexdigest(), None
+    staged.close()
+    return False, h.hexdigest(), Path(staged.name)
+
+
+def _load_cache() -> dict[str, dict]:
+    """Load install cache, returning empty dict if missing, unreadable or malformed."""
+    try:
+        cache = jsonio.loads(INSTALL_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache: dict[str, dict]) -> None:
+    """Save install cache (atomically; no-op if unchanged)."""
+    jsonio.dump(cache, INSTALL_CACHE)
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    """Cheap identity for a file's content: (size, mtime_ns)."""
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _cache_entry(
+    source_st: os.stat_result, dest_st: os.stat_result, conflict_name: str | None
+) -> dict:
+    """Snapshot source/dest stats after a compare or copy."""
+    return {
+        "source": _stat_key(source_st),
+        "dest": _stat_key(dest_st),
+        "conflict": conflict_name,
+    }
+
+
+def _cached_result(
+    cache: dict[str, dict],
+    name: str,
+    dest: Path,
+    source_st: os.stat_result,
+    dest_st: os.stat_result,
+) -> CopyResult | None:
+    """
+    Reuse the outcome of a previous install if neither file changed since.
+
+    Returns None on any mismatch, so the caller falls back to comparing bytes.
+    """
+    entry = cache.get(str(dest))
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("source") != _stat_key(source_st) or entry.get("dest") != _stat_key(dest_st):
+        return None
+
+    conflict_name = entry.get("conflict")
+    if conflict_name is None:
+        return CopyResult(name=name, status=CopyStatus.SKIPPED)
+    if not isinstance(conflict_name, str):
+        return None
+
+    conflict_dest = HOOKS_DIR / conflict_name
+    if not conflict_dest.exists():
+        return None
+    return CopyResult(
+        name=name,
+        status=CopyStatus.CONFLICT,
+        conflict_path=str(conflict_dest),
+    )
 
 
 def copy_hooks() -> list[CopyResult]:
@@ -79,81 +217,113 @@ def copy_hooks() -> list[CopyResult]:
     Conflict handling:
     - Identical content: skip silently
     - Different content: install as name-<hash>.ext
+
+    Outcomes are cached by (size, mtime) so unchanged files aren't re-read.
     """
     ensure_dirs()
     hooks_source = get_bundled_hooks_dir()
+    cache = _load_cache()
     results = []
 
-    for hook_file in hooks_source.iterdir():
-        if hook_file.name.startswith("_"):
-            continue
-        if hook_file.suffix not in (".py", ".sh"):
-            continue
-
-        dest = HOOKS_DIR / hook_file.name
-
-        if dest.exists():
-            if files_identical(hook_file, dest):
-                results.append(CopyResult(name=hook_file.name, status=CopyStatus.SKIPPED))
-            else:
-                # Conflict: install with hash suffix
-                stem = hook_file.stem
-                suffix = hook_file.suffix
-                content_hash = file_hash(hook_file)
-                conflict_name = f"{stem}-{content_hash}{suffix}"
-                conflict_dest = HOOKS_DIR / conflict_name
-                shutil.copy2(hook_file, conflict_dest)
-                conflict_dest.chmod(conflict_dest.stat().st_mode | 0o111)
-                results.append(
-                    CopyResult(
-                        name=hook_file.name,
-                        status=CopyStatus.CONFLICT,
-                        conflict_path=str(conflict_dest),
-                    )
+    with os.scandir(hooks_source) as entries:
+        for entry in entries:
+            if entry.name.startswith("_"):
+                continue
+            if not entry.name.endswith((".py", ".sh")):
+                continue
+            if not entry.is_file():  # d_type from the listing, no extra stat
+                continue
+
+            dest = HOOKS_DIR / entry.name
+            source_st = entry.stat()  # cached on the DirEntry after first call
+            try:
+                dest_st = dest.stat()
+            except FileNotFoundError:
+                dest_st = None
+
+            if dest_st is None:
+                _fast_copy(entry.path, dest)
+                os.chmod(dest, HOOK_MODE)
+                results.append(CopyResult(name=entry.name, status=CopyStatus.COPIED))
+                cache[str(dest)] = _cache_entry(source_st, dest.stat(), None)
+                continue
+
+            cached = _cached_result(cache, entry.name, dest, source_st, dest_st)
+            if cached is not None:
+                results.append(cached)
+                continue
+
+            # Only now, with bytes to read, is a Path for the source needed
+            hook_file = Path(entry.path)
+            identical, content_hash, staged = _stream_compare_hash_copy(
+                hook_file, dest, same_size=source_st.st_size == dest_st.st_size
+            )
+            if identical:
+                results.append(CopyResult(name=entry.name, status=CopyStatus.SKIPPED))
+                cache[str(dest)] = _cache_entry(source_st, dest_st, None)
+                continue
+
+            # Conflict: install with hash suffix
+            conflict_name = f"{hook_file.stem}-{content_hash}{hook_file.suffix}"
+            conflict_dest = HOOKS_DIR / conflict_name
+            shutil.copystat(hook_file, staged)
+            os.chmod(staged, HOOK_MODE)
+            os.replace(staged, conflict_dest)
+            results.append(
+                CopyResult(
+                    name=entry.name,
+                    status=CopyStatus.CONFLICT,
+                    conflict_path=str(conflict_dest),
                 )
-        else:
-            shutil.copy2(hook_file, dest)
-            dest.chmod(dest.stat().st_mode | 0o111)
-            results.append(CopyResult(name=hook_file.name, status=CopyStatus.COPIED))
+            )
+            cache[str(dest)] = _cache_entry(source_st, dest_st, conflict_name)
 
+    _save_cache(cache)
     return results
 
 
 def copy_templates() -> list[str]:
     """Copy example config templates. Returns list of copied files."""
     ensure_dirs()
-    import claude_guardrails.templates as templates_module
-
-    templates_source = Path(templates_module.__file__).parent
+    templates_source = get_bundled_templates_dir()
     copied = []
 
-    for template_file in templates_source.iterdir():
-        if template_file.name.startswith("_"):
-            continue
-        if template_file.suffix in (".json", ".md", ".yaml", ".example"):
+    with os.scandir(templates_source) as entries:
+        for entry in entries:
+            if entry.name.startswith("_"):
+                continue
+            if not entry.name.endswith((".json", ".md", ".yaml", ".example")):
+                continue
+            if not entry.is_file():
+                continue
+
             # For .example files, copy without the .example suffix if target doesn't exist
-            if template_file.name.endswith(".example"):
-                dest_name = template_file.name.removesuffix(".example")
-                dest = GUARDRAILS_DIR / dest_name
-                if not dest.exists():
-                    shutil.copy2(template_file, dest)
-                    copied.append(dest_name)
-            else:
-                dest = GUARDRAILS_DIR / template_file.name
-                if not dest.exists():
-                    shutil.copy2(template_file, dest)
-                    copied.append(template_file.name)
+            dest_name = entry.name.removesuffix(".example")
+            dest = GUARDRAILS_DIR / dest_name
+            try:
+                # Create-if-absent in one syscall: no exists() check, no race
+                os.close(os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            except FileExistsError:
+                continue
+            try:
+                _fast_copy(entry.path, dest)
+            except BaseException:
+                dest.unlink(missing_ok=True)  # don't leave an empty file claiming the name
+                raise
+            copied.append(dest_name)
 
     return copied
 
 
 def enable_all_guardrails() -> dict[str, bool]:
     """Enable all guardrails. Returns dict of guardrail -> was_newly_enabled."""
-    results = {}
-    results["reminders"] = register_hook(PERIODIC_REMINDERS_HOOK)
-    results["progressive-disclosure"] = register_hook(PROGRESSIVE_DISCLOSURE_HOOK)
-    results["url-discipline"] = register_hook(URL_DISCIPLINE_HOOK)
-    return results
+    guardrails = {
+        "reminders": PERIODIC_REMINDERS_HOOK,
+        "progressive-disclosure": PROGRESSIVE_DISCLOSURE_HOOK,
+        "url-discipline": URL_DISCIPLINE_HOOK,
+    }
+    added = register_hooks(guardrails.values())
+    return dict(zip(guardrails, added))
 
 
 def run_install(enable_all: bool = False) -> None:
@@ -213,12 +383,7 @@ def run_install(enable_all: bool = False) -> None:
 
 
 def show_status() -> None:
-    """Show status of all guardrails."""
-    table = Table(title="Claude Guardrails Status")
-    table.add_column("Guardrail", style="cyan")
-    table.add_column("Hook Installed", style="dim")
-    table.add_column("Hook Enabled", style="bold")
-
+    """Show status of all guardrails (plain tab-separated rows when piped)."""
     # Check each guardrail
     guardrails = [
         ("Periodic Reminders", "periodic-reminders.sh", PERIODIC_REMINDERS_HOOK),
@@ -230,10 +395,30 @@ def show_status() -> None:
         ("URL Discipline", "webfetch-url-discipline.py", URL_DISCIPLINE_HOOK),
     ]
 
-    for name, hook_file, hook_spec in guardrails:
-        installed = (HOOKS_DIR / hook_file).exists()
-        enabled = is_hook_registered(hook_spec)
+    # One directory listing for all guardrails; registrations come from the cached index
+    try:
+        with os.scandir(HOOKS_DIR) as entries:
+            installed_names = frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        installed_names = frozenset()
+
+    rows = [
+        (name, hook_file in installed_names, is_hook_registered(hook_spec))
+        for name, hook_file, hook_spec in guardrails
+    ]
+
+    if not console.is_terminal:
+        # Scripted invocation: skip rich markup and table layout
+        for name, installed, enabled in rows:
+            print(f"{name}\t{'yes' if installed else 'no'}\t{'yes' if enabled else 'no'}")
+        return
+
+    table = Table(title="Claude Guardrails Status")
+    table.add_column("Guardrail", style="cyan")
+    table.add_column("Hook Installed", style="dim")
+    table.add_column("Hook Enabled", style="bold")
 
+    for name, installed, enabled in rows:
         installed_str = "[green]Yes[/green]" if installed else "[red]No[/red]"
         enabled_str = "[green]Yes[/green]" if enabled else "[dim]No[/dim]"
 
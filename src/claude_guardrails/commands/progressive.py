@@ -6,18 +6,16 @@ import typer
 from rich.console import Console
 
 from claude_guardrails.paths import HOOKS_DIR
-from claude_guardrails.settings import HookSpec, is_hook_registered, register_hook, unregister_hook
-from claude_guardrails.types import HookEvent
+from claude_guardrails.settings import (
+    PROGRESSIVE_DISCLOSURE_HOOK as HOOK_SPEC,
+    is_hook_registered,
+    register_hook,
+    unregister_hook,
+)
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
-HOOK_SPEC = HookSpec(
-    event=HookEvent.PRE_TOOL_USE,
-    matcher="Read",
-    command="~/.claude/hooks/structured-file-nudge.py",
-)
-
 
 @app.command()
 def enable() -> None:
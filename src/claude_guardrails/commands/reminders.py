@@ -2,9 +2,9 @@
 Reminders CLI commands - manage periodic reminders for Claude Code.
 """
 
-import json
+import os
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
 import typer
@@ -12,21 +12,20 @@ from rich.console import Console
 from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.table import Table
 
+from claude_guardrails import jsonio
 from claude_guardrails.paths import REMINDERS_CONFIG, REMINDERS_STATE_DIR, ensure_dirs
-from claude_guardrails.settings import HookSpec, is_hook_registered, register_hook, unregister_hook
-from claude_guardrails.types import HookEvent
+from claude_guardrails.settings import (
+    PERIODIC_REMINDERS_HOOK as HOOK_SPEC,
+    is_hook_registered,
+    register_hook,
+    unregister_hook,
+)
 
 app = typer.Typer(no_args_is_help=True)
 console = Console()
 
-HOOK_SPEC = HookSpec(
-    event=HookEvent.USER_PROMPT_SUBMIT,
-    matcher=None,
-    command="~/.claude/hooks/periodic-reminders.sh",
-)
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reminder:
     """A periodic reminder configuration."""
 
@@ -40,15 +39,30 @@ def load_reminders() -> list[Reminder]:
     """Load reminders from config file."""
     if not REMINDERS_CONFIG.exists():
         return []
-    data = json.loads(REMINDERS_CONFIG.read_text())
+    data = jsonio.loads(REMINDERS_CONFIG.read_bytes())
     return [Reminder(**r) for r in data.get("reminders", [])]
 
 
+def load_reminders_map() -> dict[str, Reminder]:
+    """Load reminders keyed by ID, in config file order."""
+    return {r.id: r for r in load_reminders()}
+
+
 def save_reminders(reminders: list[Reminder]) -> None:
     """Save reminders to config file."""
     ensure_dirs()
-    data = {"reminders": [asdict(r) for r in reminders]}
-    REMINDERS_CONFIG.write_text(json.dumps(data, indent=2) + "\n")
+    data = {
+        "reminders": [
+            {
+                "id": r.id,
+                "interval_turns": r.interval_turns,
+                "interval_seconds": r.interval_seconds,
+                "message": r.message,
+            }
+            for r in reminders
+        ]
+    }
+    jsonio.dump(data, REMINDERS_CONFIG)
 
 
 @app.command()
@@ -86,8 +100,14 @@ def list_reminders() -> None:
     table.add_column("Message", max_width=50)
 
     for r in reminders:
-        msg_preview = r.message[:47] + "..." if len(r.message) > 50 else r.message
-        msg_preview = msg_preview.replace("\n", "\\n")
+        # First line only: later lines would be truncated away anyway
+        first_line, more_lines, _ = r.message.partition("\n")
+        if len(first_line) > 50:
+            msg_preview = first_line[:47] + "..."
+        elif more_lines:
+            msg_preview = first_line + "..."
+        else:
+            msg_preview = first_line
         table.add_row(
             r.id, str(r.interval_turns), str(r.interval_seconds), msg_preview
         )
@@ -110,7 +130,7 @@ def add(
     message: str | None = typer.Option(None, "--message", "-m", help="Reminder message"),
 ) -> None:
     """Add a new reminder (interactive if options not provided)."""
-    reminders = load_reminders()
+    reminders = load_reminders_map()
 
     # Interactive prompts if not provided
     if id is None:
@@ -118,7 +138,7 @@ def add(
         id = Prompt.ask("Reminder ID", default=default_id)
 
     # Check for duplicate
-    if any(r.id == id for r in reminders):
+    if id in reminders:
         console.print(f"[red]Error:[/red] Reminder with ID '{id}' already exists")
         raise typer.Exit(1)
 
@@ -140,8 +160,8 @@ def add(
         message = "\n".join(lines) if lines else f"<reminder id=\"{id}\"/>"
 
     reminder = Reminder(id=id, interval_turns=turns, interval_seconds=seconds, message=message)
-    reminders.append(reminder)
-    save_reminders(reminders)
+    reminders[id] = reminder
+    save_reminders(list(reminders.values()))
 
     console.print(f"\n[green]✓[/green] Added reminder: {id}")
     console.print(f"  Triggers every {turns} turns OR {seconds} seconds")
@@ -150,15 +170,13 @@ def add(
 @app.command()
 def remove(reminder_id: str = typer.Argument(..., help="ID of reminder to remove")) -> None:
     """Remove a reminder by ID."""
-    reminders = load_reminders()
-    original_count = len(reminders)
-    reminders = [r for r in reminders if r.id != reminder_id]
+    reminders = load_reminders_map()
 
-    if len(reminders) == original_count:
+    if reminders.pop(reminder_id, None) is None:
         console.print(f"[red]Error:[/red] No reminder found with ID '{reminder_id}'")
         raise typer.Exit(1)
 
-    save_reminders(reminders)
+    save_reminders(list(reminders.values()))
 
     # Also clean up state file
     state_file = REMINDERS_STATE_DIR / f"{reminder_id}.state"
@@ -171,8 +189,7 @@ def remove(reminder_id: str = typer.Argument(..., help="ID of reminder to remove
 @app.command()
 def show(reminder_id: str = typer.Argument(..., help="ID of reminder to show")) -> None:
     """Show details of a specific reminder."""
-    reminders = load_reminders()
-    reminder = next((r for r in reminders if r.id == reminder_id), None)
+    reminder = load_reminders_map().get(reminder_id)
 
     if reminder is None:
         console.print(f"[red]Error:[/red] No reminder found with ID '{reminder_id}'")
@@ -201,9 +218,14 @@ def reset(
     """Reset state for a reminder (or all reminders)."""
     if reminder_id == "all":
         count = 0
-        for state_file in REMINDERS_STATE_DIR.glob("*.state"):
-            state_file.unlink()
-            count += 1
+        try:
+            with os.scandir(REMINDERS_STATE_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".state"):
+                        os.unlink(entry.path)
+                        count += 1
+        except FileNotFoundError:
+            pass  # no state directory yet: nothing to reset
         console.print(f"[green]✓[/green] Reset {count} reminder state files")
     else:
         state_file = REMINDERS_STATE_DIR / f"{reminder_id}.state"
@@ -2,21 +2,53 @@
 URL Discipline CLI commands - manage WebFetch URL validation.
 """
 
+import functools
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
-from claude_guardrails.paths import HOOKS_DIR
-from claude_guardrails.settings import HookSpec, is_hook_registered, register_hook, unregister_hook
-from claude_guardrails.types import HookEvent
+from claude_guardrails import jsonio
+from claude_guardrails.paths import HOOKS_DIR, URL_ALLOWLIST
+from claude_guardrails.settings import (
+    URL_DISCIPLINE_HOOK as HOOK_SPEC,
+    is_hook_registered,
+    register_hook,
+    unregister_hook,
+)
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(no_args_is_help=True)
-console = Console()
 
-HOOK_SPEC = HookSpec(
-    event=HookEvent.PRE_TOOL_USE,
-    matcher="WebFetch",
-    command="~/.claude/hooks/webfetch-url-discipline.py",
-)
+
+@functools.cache
+def _console() -> "Console":
+    """Rich console, created on first output (keeps rich out of import time)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def load_allowlist() -> list[str]:
+    """
+    Load allowlist patterns from config file.
+
+    Missing or malformed file means none, and non-string entries are
+    dropped: the same reading as the hook's.
+    """
+    try:
+        patterns = jsonio.loads(URL_ALLOWLIST.read_bytes()).get("patterns", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+    if not isinstance(patterns, list):
+        return []
+    return [p for p in patterns if isinstance(p, str)]
+
+
+def save_allowlist(patterns: list[str]) -> None:
+    """Save allowlist patterns to config file."""
+    jsonio.dump({"patterns": patterns}, URL_ALLOWLIST)
 
 
 @app.command()
@@ -24,23 +56,23 @@ def enable() -> None:
     """Enable the URL discipline hook."""
     hook_file = HOOKS_DIR / "webfetch-url-discipline.py"
     if not hook_file.exists():
-        console.print("[red]Error:[/red] Hook not installed. Run 'claude-guardrails install' first.")
+        _console().print("[red]Error:[/red] Hook not installed. Run 'claude-guardrails install' first.")
         raise typer.Exit(1)
 
     if register_hook(HOOK_SPEC):
-        console.print("[green]✓[/green] URL discipline hook enabled")
-        console.print("  WebFetch calls to deep paths will now prompt for confirmation")
+        _console().print("[green]✓[/green] URL discipline hook enabled")
+        _console().print("  WebFetch calls to deep paths will now prompt for confirmation")
     else:
-        console.print("[dim]○[/dim] URL discipline hook already enabled")
+        _console().print("[dim]○[/dim] URL discipline hook already enabled")
 
 
 @app.command()
 def disable() -> None:
     """Disable the URL discipline hook."""
     if unregister_hook(HOOK_SPEC):
-        console.print("[green]✓[/green] URL discipline hook disabled")
+        _console().print("[green]✓[/green] URL discipline hook disabled")
     else:
-        console.print("[dim]○[/dim] URL discipline hook was not enabled")
+        _console().print("[dim]○[/dim] URL discipline hook was not enabled")
 
 
 @app.command()
@@ -50,11 +82,80 @@ def status() -> None:
     installed = hook_file.exists()
     enabled = is_hook_registered(HOOK_SPEC)
 
-    console.print("\n[bold]URL Discipline Status[/bold]")
-    console.print(f"  Hook installed: {'[green]Yes[/green]' if installed else '[red]No[/red]'}")
-    console.print(f"  Hook enabled: {'[green]Yes[/green]' if enabled else '[dim]No[/dim]'}")
+    _console().print("\n[bold]URL Discipline Status[/bold]")
+    _console().print(f"  Hook installed: {'[green]Yes[/green]' if installed else '[red]No[/red]'}")
+    _console().print(f"  Hook enabled: {'[green]Yes[/green]' if enabled else '[dim]No[/dim]'}")
+
+    _console().print("\n[dim]Safe entry points (always allowed):[/dim]")
+    _console().print("  /, /en/stable/, /en/latest/, /docs/, /sitemap.xml, /robots.txt")
+    _console().print(f"\n[dim]Allowlisted patterns:[/dim] {len(load_allowlist())}")
+    _console().print("\n[dim]Other deep paths trigger confirmation dialog[/dim]")
+    _console().print()
+
+
+@app.command()
+def allow(
+    pattern: str = typer.Argument(
+        ...,
+        help="host[/path-glob], e.g. docs.python.org or '*.readthedocs.io/en/*'"
+        " (in the path glob, * also matches '/')",
+    ),
+) -> None:
+    """
+    Allow deep paths matching a pattern without confirmation.
+
+    The path glob's `*` spans segments: 'github.com/me/*' allows every URL under /me/.
+    """
+    if "://" in pattern:
+        _console().print("[red]Error:[/red] Patterns are host[/path-glob], without a scheme")
+        raise typer.Exit(1)
+    host = pattern.partition("/")[0]
+    if not host or host == "*.":
+        _console().print(
+            "[red]Error:[/red] Pattern needs a host: exact, '*.parent.domain' or '*'"
+        )
+        raise typer.Exit(1)
+
+    patterns = load_allowlist()
+    if pattern in patterns:
+        _console().print(f"[dim]○[/dim] Already allowed: {pattern}")
+        return
+
+    patterns.append(pattern)
+    save_allowlist(patterns)
+    _console().print(f"[green]✓[/green] Allowed: {pattern}")
+
+
+@app.command()
+def deny(pattern: str = typer.Argument(..., help="Pattern to remove from the allowlist")) -> None:
+    """Remove a pattern from the allowlist."""
+    patterns = load_allowlist()
+    if pattern not in patterns:
+        _console().print(f"[red]Error:[/red] Pattern not in allowlist: '{pattern}'")
+        raise typer.Exit(1)
+
+    patterns.remove(pattern)
+    save_allowlist(patterns)
+    _console().print(f"[green]✓[/green] Removed: {pattern}")
+
+
+@app.command("list")
+def list_patterns() -> None:
+    """List allowlisted URL patterns."""
+    patterns = load_allowlist()
+
+    if not patterns:
+        _console().print("[dim]No allowlisted patterns.[/dim]")
+        _console().print("Use [bold]url-discipline allow[/bold] to add one.")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="URL Allowlist")
+    table.add_column("Pattern", style="cyan")
+    for pattern in patterns:
+        table.add_row(pattern)
 
-    console.print("\n[dim]Safe entry points (always allowed):[/dim]")
-    console.print("  /, /en/stable/, /en/latest/, /docs/, /sitemap.xml, /robots.txt")
-    console.print("\n[dim]Deep paths trigger confirmation dialog[/dim]")
-    console.print()
+    _console().print()
+    _console().print(table)
+    _console().print()
@@ -12,20 +12,22 @@ Architecture: Functional core, imperative shell
 """
 
 import json
-import subprocess
+import os
+import stat
 import sys
-from dataclasses import dataclass
 from enum import Enum
+from typing import NamedTuple
 
 
 # =============================================================================
 # CONFIGURATION (Data)
 # =============================================================================
 
-STRUCTURED_EXTENSIONS = frozenset({".json", ".yaml", ".yml"})
+STRUCTURED_EXTENSIONS = (".json", ".yaml", ".yml")  # tuple: usable with str.endswith
 SMALL_FILE_THRESHOLD = 100      # lines: no nudge
 MEDIUM_FILE_THRESHOLD = 250     # lines: gentle nudge
 # above MEDIUM: strong nudge
+LINE_COUNT_CHUNK_SIZE = 64 * 1024  # bytes per read when counting lines
 
 
 # =============================================================================
@@ -38,21 +40,19 @@ class NudgeLevel(Enum):
     STRONG = "strong"
 
 
-@dataclass(frozen=True)
-class FileInfo:
+class FileInfo(NamedTuple):
     path: str
     extension: str
     line_count: int | None
+    line_count_capped: bool = False  # counting stopped early: at least line_count lines
 
 
-@dataclass(frozen=True)
-class HookInput:
+class HookInput(NamedTuple):
     tool_name: str
     file_path: str
 
 
-@dataclass(frozen=True)
-class HookOutput:
+class HookOutput(NamedTuple):
     should_add_context: bool
     context_message: str | None
     permission_decision: str  # "allow" | "ask"
@@ -70,10 +70,12 @@ def parse_hook_input(raw: dict) -> HookInput:
     )
 
 
-def extract_extension(path: str) -> str:
-    """Get lowercase file extension."""
-    import os
-    return os.path.splitext(path)[1].lower()
+def extract_structured_extension(path: str) -> str | None:
+    """Get lowercase extension if path is a structured file, else None."""
+    lowered = path.lower()
+    if not lowered.endswith(STRUCTURED_EXTENSIONS):
+        return None
+    return lowered[lowered.rindex("."):]
 
 
 def is_structured_file(extension: str) -> bool:
@@ -106,6 +108,8 @@ def format_nudge_message(file_info: FileInfo, nudge_level: NudgeLevel) -> str |
 
     tool = query_tool_for_extension(file_info.extension)
     line_count = file_info.line_count or "unknown"
+    if file_info.line_count_capped:
+        line_count = f"{line_count}+"
 
     preamble = {
         NudgeLevel.GENTLE: f"Note: {file_info.path} is {line_count} lines (structured file).",
@@ -136,11 +140,8 @@ def decide_hook_output(file_info: FileInfo) -> HookOutput:
     )
 
 
-def render_output(hook_output: HookOutput) -> str | None:
+def render_output(hook_output: HookOutput) -> str:
     """Serialize hook output to JSON for Claude Code. Pure transformation."""
-    if not hook_output.should_add_context:
-        return None
-
     output = {
         "hookSpecificOutput": {
             "hookEventName": "PreToolUse",
@@ -156,24 +157,34 @@ def render_output(hook_output: HookOutput) -> str | None:
 # =============================================================================
 
 def read_stdin() -> dict:
-    """Effect: Read and parse JSON from stdin."""
-    return json.load(sys.stdin)
+    """Effect: Read and parse JSON from stdin (raw bytes, no text decoding layer)."""
+    return json.loads(sys.stdin.buffer.read())
+
+
+def get_line_count(path: str, limit: int) -> int | None:
+    """
+    Effect: Count lines in file (newlines, like `wc -l`), one reused buffer.
 
+    Stops reading once `limit` lines are seen and returns `limit`: past the
+    top threshold the exact count doesn't change the nudge.
 
-def get_line_count(path: str) -> int | None:
-    """Effect: Count lines in file via subprocess."""
+    Only regular files are counted (None otherwise): the open is non-blocking,
+    so a FIFO or device named *.json can't hang the hook.
+    """
     try:
-        result = subprocess.run(
-            ["wc", "-l", path],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return int(result.stdout.split()[0])
-    except (subprocess.TimeoutExpired, ValueError, IndexError, FileNotFoundError):
-        pass
-    return None
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        with open(fd, "rb", buffering=0) as f:
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                return None
+            buf = bytearray(LINE_COUNT_CHUNK_SIZE)
+            count = 0
+            while n := f.readinto(buf):
+                count += buf.count(b"\n", 0, n)
+                if count >= limit:
+                    return limit
+            return count
+    except OSError:
+        return None
 
 
 def write_stdout(content: str) -> None:
@@ -202,34 +213,38 @@ def main() -> int:
 
     # Pure: parse
     hook_input = parse_hook_input(raw_input)
-    extension = extract_extension(hook_input.file_path)
+    extension = extract_structured_extension(hook_input.file_path)
 
     # Short-circuit: not a structured file
-    if not is_structured_file(extension):
+    if extension is None:
         return 0
 
-    # Effect: get file metadata
-    line_count = get_line_count(hook_input.file_path)
+    # Effect: get file metadata (counting stops at the strong-nudge threshold)
+    line_count = get_line_count(hook_input.file_path, MEDIUM_FILE_THRESHOLD)
 
     # Pure: build domain object
     file_info = FileInfo(
         path=hook_input.file_path,
         extension=extension,
         line_count=line_count,
+        line_count_capped=line_count == MEDIUM_FILE_THRESHOLD,
     )
 
     # Pure: decide
     hook_output = decide_hook_output(file_info)
 
-    # Pure: render
-    rendered = render_output(hook_output)
+    # Short-circuit: nothing to say, no JSON to build
+    if not hook_output.should_add_context:
+        return 0
 
-    # Effect: write
-    if rendered:
-        write_stdout(rendered)
+    # Pure: render; Effect: write
+    write_stdout(render_output(hook_output))
 
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_code = main()
+    # Nothing to clean up: flush what was written, skip interpreter teardown
+    sys.stdout.flush()
+    os._exit(exit_code)
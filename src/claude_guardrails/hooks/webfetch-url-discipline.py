@@ -10,10 +10,12 @@ Architecture: Functional core, imperative shell
 """
 
 import json
+import os
+import re
 import sys
-from dataclasses import dataclass
 from enum import Enum
-from urllib.parse import urlparse
+from fnmatch import fnmatchcase
+from typing import NamedTuple
 
 
 # =============================================================================
@@ -31,6 +33,16 @@ ROOT_PATH_PATTERNS = frozenset({
     "/robots.txt",
 })
 
+# Compiled once: any root pattern (trailing slashes ignored) plus optional slashes
+ROOT_PATH_RE = re.compile(
+    "(?:"
+    + "|".join(sorted(re.escape(p.rstrip("/")) for p in ROOT_PATH_PATTERNS if p.rstrip("/")))
+    + ")?/*"
+)
+
+# User-approved hosts/paths (managed by `claude-guardrails url-discipline allow`)
+ALLOWLIST_PATH = os.path.expanduser("~/.claude/guardrails/url-allowlist.json")
+
 
 # =============================================================================
 # DOMAIN TYPES (Data)
@@ -38,25 +50,29 @@ ROOT_PATH_PATTERNS = frozenset({
 
 class UrlOrigin(Enum):
     ROOT_ENTRY = "root_entry"        # Known safe entry point
+    ALLOWLISTED = "allowlisted"      # Matches a user-approved pattern
     DEEP_PATH = "deep_path"          # Could be constructed/guessed
 
 
-@dataclass(frozen=True)
-class UrlInfo:
+class UrlInfo(NamedTuple):
     full_url: str
     host: str
     path: str
 
 
-@dataclass(frozen=True)
-class HookInput:
+class UrlPatternSet(NamedTuple):
+    """Allowlist patterns bucketed by host; values are path globs (None = any path)."""
+    exact: dict[str, list[str | None]]      # "docs.python.org"
+    wildcard: dict[str, list[str | None]]   # "*.readthedocs.io" -> "readthedocs.io", "*" -> ""
+
+
+class HookInput(NamedTuple):
     tool_name: str
     url: str
     prompt: str
 
 
-@dataclass(frozen=True)
-class HookOutput:
+class HookOutput(NamedTuple):
     should_add_context: bool
     context_message: str | None
     permission_decision: str  # "allow" | "ask"
@@ -77,32 +93,106 @@ def parse_hook_input(raw: dict) -> HookInput:
 
 
 def parse_url(url: str) -> UrlInfo:
-    """Parse URL into components."""
-    parsed = urlparse(url)
+    """
+    Split URL into host and path; query and fragment are dropped.
+
+    `\\` counts as `/`, as in browsers (WHATWG) for http(s): the host of
+    `https://evil.com\\@docs.python.org/` is `evil.com`, not `docs.python.org`.
+    """
+    rest = url.split("://", 1)[-1].split("#", 1)[0].split("?", 1)[0].replace("\\", "/")
+    host, slash, path = rest.partition("/")
     return UrlInfo(
         full_url=url,
-        host=parsed.netloc,
-        path=parsed.path,
+        host=host,
+        path=slash + path,
+    )
+
+
+def build_url_pattern_set(patterns: list[str]) -> UrlPatternSet:
+    """
+    Index `host[/path-glob]` patterns by host.
+
+    Host is exact, `*.parent.domain` (any subdomain) or `*` (any host).
+    """
+    exact: dict[str, list[str | None]] = {}
+    wildcard: dict[str, list[str | None]] = {}
+    for pattern in patterns:
+        host, slash, path = pattern.partition("/")
+        host = host.lower()
+        path_glob = "/" + path if slash else None
+        if host == "*":
+            wildcard.setdefault("", []).append(path_glob)
+        elif host.startswith("*."):
+            wildcard.setdefault(host[2:], []).append(path_glob)
+        else:
+            exact.setdefault(host, []).append(path_glob)
+    return UrlPatternSet(exact=exact, wildcard=wildcard)
+
+
+def normalize_host(netloc: str) -> str:
+    """Strip userinfo and port, lowercase: 'u@Docs.Example.com:443' -> 'docs.example.com'."""
+    return netloc.rpartition("@")[2].partition(":")[0].lower()
+
+
+def resolve_dot_segments(path: str) -> str:
+    """
+    Resolve `.` and `..` path segments the way the fetch will: '/a/../b' -> '/b'.
+
+    `%2e` counts as `.`, so '/a/%2e%2e/b' is also '/b'.
+    """
+    segments = path.split("/")
+    resolved = segments[:1]  # "" for an absolute path
+    for segment in segments[1:]:
+        dots = segment.lower().replace("%2e", ".")
+        if dots == "..":
+            if len(resolved) > 1:
+                resolved.pop()
+        elif dots != ".":
+            resolved.append(segment)
+    if segments[-1].lower().replace("%2e", ".") in (".", ".."):
+        resolved.append("")  # '/a/b/..' -> '/a/'
+    return "/".join(resolved)
+
+
+def is_allowlisted(url_info: UrlInfo, pattern_set: UrlPatternSet) -> bool:
+    """
+    Check URL against the allowlist.
+
+    Probes the exact host, then each parent domain's wildcard bucket, then `*`:
+    cost grows with the host's label count, not the number of patterns.
+    Path globs see the path with dot segments resolved, so `/m-gris/../evil`
+    can't pass `github.com/m-gris/*`. A glob's `*` also matches `/`.
+    """
+    if "\\" in url_info.host:
+        return False  # Ambiguous authority: never trust it
+    host = normalize_host(url_info.host)
+    path = resolve_dot_segments(url_info.path) or "/"
+
+    buckets = [pattern_set.exact.get(host)]
+    labels = host.split(".")
+    for i in range(1, len(labels)):
+        buckets.append(pattern_set.wildcard.get(".".join(labels[i:])))
+    buckets.append(pattern_set.wildcard.get(""))
+
+    return any(
+        path_glob is None or fnmatchcase(path, path_glob)
+        for bucket in buckets
+        if bucket
+        for path_glob in bucket
     )
 
 
 def is_root_entry_point(url_info: UrlInfo) -> bool:
     """Check if URL is a known safe entry point (root, sitemap, etc.)."""
-    # Normalize path for comparison
-    path = url_info.path.rstrip("/") + "/" if url_info.path else "/"
-    path_without_slash = url_info.path.rstrip("/")
-
-    return (
-        path in ROOT_PATH_PATTERNS
-        or path_without_slash in ROOT_PATH_PATTERNS
-        or url_info.path == ""
-    )
+    return ROOT_PATH_RE.fullmatch(url_info.path) is not None
 
 
-def classify_url(url_info: UrlInfo) -> UrlOrigin:
+def classify_url(url_info: UrlInfo, allowlist: UrlPatternSet) -> UrlOrigin:
     """Classify URL by likely origin."""
     if is_root_entry_point(url_info):
         return UrlOrigin.ROOT_ENTRY
+    if is_allowlisted(url_info, allowlist):
+        return UrlOrigin.ALLOWLISTED
     return UrlOrigin.DEEP_PATH
 
 
@@ -125,11 +215,11 @@ STOP and fetch the sitemap or index page first:
 URLs are discovered, not invented."""
 
 
-def decide_hook_output(url_info: UrlInfo) -> HookOutput:
-    """Main decision function: given URL info, produce hook output."""
-    origin = classify_url(url_info)
+def decide_hook_output(url_info: UrlInfo, allowlist: UrlPatternSet) -> HookOutput:
+    """Main decision function: given URL info and allowlist, produce hook output."""
+    origin = classify_url(url_info, allowlist)
 
-    if origin == UrlOrigin.ROOT_ENTRY:
+    if origin in (UrlOrigin.ROOT_ENTRY, UrlOrigin.ALLOWLISTED):
         return HookOutput(
             should_add_context=False,
             context_message=None,
@@ -144,11 +234,8 @@ def decide_hook_output(url_info: UrlInfo) -> HookOutput:
     )
 
 
-def render_output(hook_output: HookOutput) -> str | None:
+def render_output(hook_output: HookOutput) -> str:
     """Serialize hook output to JSON for Claude Code."""
-    if not hook_output.should_add_context:
-        return None
-
     output = {
         "hookSpecificOutput": {
             "hookEventName": "PreToolUse",
@@ -164,8 +251,20 @@ def render_output(hook_output: HookOutput) -> str | None:
 # =============================================================================
 
 def read_stdin() -> dict:
-    """Effect: Read and parse JSON from stdin."""
-    return json.load(sys.stdin)
+    """Effect: Read and parse JSON from stdin (raw bytes, no text decoding layer)."""
+    return json.loads(sys.stdin.buffer.read())
+
+
+def read_allowlist() -> list[str]:
+    """Effect: Read allowlist patterns. Missing or malformed file means none."""
+    try:
+        with open(ALLOWLIST_PATH, "rb") as f:
+            patterns = json.loads(f.read()).get("patterns", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+    if not isinstance(patterns, list):
+        return []
+    return [p for p in patterns if isinstance(p, str)]
 
 
 def write_stdout(content: str) -> None:
@@ -194,19 +293,27 @@ def main() -> int:
     # Pure: parse URL
     url_info = parse_url(hook_input.url)
 
-    # Pure: decide
-    hook_output = decide_hook_output(url_info)
+    # Short-circuit: known entry point, no need to read the allowlist
+    if is_root_entry_point(url_info):
+        return 0
 
-    # Pure: render
-    rendered = render_output(hook_output)
+    # Effect: read allowlist; Pure: index it
+    allowlist = build_url_pattern_set(read_allowlist())
 
-    # Effect: write and block if deep path
-    if rendered:
-        write_stdout(rendered)
-        return 2  # block tool call
+    # Pure: decide
+    hook_output = decide_hook_output(url_info, allowlist)
+
+    # Short-circuit: nothing to say, no JSON to build
+    if not hook_output.should_add_context:
+        return 0
 
-    return 0
+    # Pure: render; Effect: write and block (deep path)
+    write_stdout(render_output(hook_output))
+    return 2  # block tool call
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_code = main()
+    # Nothing to clean up: flush what was written, skip interpreter teardown
+    sys.stdout.flush()
+    os._exit(exit_code)
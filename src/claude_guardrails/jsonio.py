@@ -0,0 +1,70 @@
+"""
+JSON encoding/decoding for claude-guardrails config files.
+
+Uses orjson when it is installed (optional speedup), otherwise the stdlib.
+Both paths read bytes or str and write 2-space indented UTF-8 bytes
+(non-ASCII unescaped) with a trailing newline, so the config files written
+here look the same either way. orjson is stricter on exotic values: it
+rejects integers beyond 64 bits and non-str keys (TypeError) and writes
+NaN/Infinity as null.
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON. Raises ValueError on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, newline-terminated."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode()
+
+
+def dump(obj: Any, path: Path) -> bool:
+    """
+    Write obj as JSON to path atomically (temp file + rename).
+
+    Hook scripts read these files concurrently; they never see a partial write.
+    A symlinked path is written through (the link's target is replaced, not
+    the link), and an existing file keeps its permission bits.
+    Skips the write when path already holds the same bytes, leaving its
+    mtime untouched. Returns True if the file was written.
+    """
+    data = dumps(obj)
+    target = Path(os.path.realpath(path))
+    try:
+        if target.read_bytes() == data:
+            return False
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        # Existing file: start private, then take its mode. New file: umask default.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        fd = os.open(tmp, flags, 0o666 if mode is None else 0o600)
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
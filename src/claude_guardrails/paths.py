@@ -15,6 +15,12 @@ HOOKS_DIR = CLAUDE_HOME / "hooks"
 REMINDERS_CONFIG = GUARDRAILS_DIR / "reminders.json"
 REMINDERS_STATE_DIR = GUARDRAILS_DIR / "state"
 
+# URL discipline allowlist (host[/path-glob] patterns that skip the deep-path check)
+URL_ALLOWLIST = GUARDRAILS_DIR / "url-allowlist.json"
+
+# Install cache (stat snapshots of copied hooks, lets reinstalls skip re-reading)
+INSTALL_CACHE = GUARDRAILS_DIR / "install-cache.json"
+
 # Settings file (Claude Code's local settings)
 SETTINGS_LOCAL = CLAUDE_HOME / "settings.local.json"
 
@@ -4,10 +4,11 @@ Claude Code settings.local.json management.
 Handles reading/writing hook registrations in Claude Code's settings file.
 """
 
-import json
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
+from claude_guardrails import jsonio
 from claude_guardrails.paths import SETTINGS_LOCAL
 from claude_guardrails.types import HookEvent
 
@@ -21,27 +22,79 @@ class HookSpec:
     command: str  # Command to run
 
 
+# Bundled hooks (installed to ~/.claude/hooks/ by `claude-guardrails install`)
+PERIODIC_REMINDERS_HOOK = HookSpec(
+    event=HookEvent.USER_PROMPT_SUBMIT,
+    matcher=None,
+    command="~/.claude/hooks/periodic-reminders.sh",
+)
+
+PROGRESSIVE_DISCLOSURE_HOOK = HookSpec(
+    event=HookEvent.PRE_TOOL_USE,
+    matcher="Read",
+    command="~/.claude/hooks/structured-file-nudge.py",
+)
+
+URL_DISCIPLINE_HOOK = HookSpec(
+    event=HookEvent.PRE_TOOL_USE,
+    matcher="WebFetch",
+    command="~/.claude/hooks/webfetch-url-discipline.py",
+)
+
+
+# Every registered hook as an (event, matcher, command) triple
+RegisteredHooks = frozenset[tuple[str, str | None, str | None]]
+
+# Index of settings.local.json, keyed by the file's (mtime_ns, size) when it was built
+_index_cache: tuple[tuple[int, int], RegisteredHooks] | None = None
+
+
+def _stat_key() -> tuple[int, int] | None:
+    """(mtime_ns, size) of settings.local.json, or None if missing."""
+    try:
+        st = SETTINGS_LOCAL.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _index(settings: dict[str, Any]) -> RegisteredHooks:
+    """Flatten the hooks section into (event, matcher, command) triples."""
+    return frozenset(
+        (event_key, group.get("matcher"), hook.get("command"))
+        for event_key, groups in settings.get("hooks", {}).items()
+        for group in groups
+        for hook in group.get("hooks", [])
+    )
+
+
+def _registered_hooks() -> RegisteredHooks:
+    """Index of registered hooks, rebuilt only when settings.local.json changed."""
+    global _index_cache
+    key = _stat_key()
+    if key is None:
+        return frozenset()
+    if _index_cache is None or _index_cache[0] != key:
+        _index_cache = (key, _index(load_settings()))
+    return _index_cache[1]
+
+
 def load_settings() -> dict[str, Any]:
     """Load settings.local.json, returning empty dict if not exists."""
     if not SETTINGS_LOCAL.exists():
         return {}
-    return json.loads(SETTINGS_LOCAL.read_text())
+    return jsonio.loads(SETTINGS_LOCAL.read_bytes())
 
 
 def save_settings(settings: dict[str, Any]) -> None:
-    """Save settings to settings.local.json."""
-    SETTINGS_LOCAL.parent.mkdir(parents=True, exist_ok=True)
-    SETTINGS_LOCAL.write_text(json.dumps(settings, indent=2) + "\n")
-
+    """Save settings to settings.local.json (atomically; no-op if unchanged)."""
+    global _index_cache
+    jsonio.dump(settings, SETTINGS_LOCAL)
+    _index_cache = (_stat_key(), _index(settings))
 
-def register_hook(spec: HookSpec) -> bool:
-    """
-    Register a hook in settings.local.json.
-
-    Returns True if hook was added, False if already exists.
-    """
-    settings = load_settings()
 
+def _add_hook(settings: dict[str, Any], spec: HookSpec) -> bool:
+    """Add a hook entry to settings in place. Returns False if already present."""
     # Ensure hooks structure exists
     event_key = spec.event.value
     if "hooks" not in settings:
@@ -71,16 +124,36 @@ def register_hook(spec: HookSpec) -> bool:
         event_hooks.append(target_group)
 
     # Check if hook already registered
-    for existing in target_group["hooks"]:
-        if existing.get("command") == spec.command:
-            return False  # Already exists
+    if any(h.get("command") == spec.command for h in target_group["hooks"]):
+        return False  # Already exists
 
     # Add the hook
     target_group["hooks"].append(hook_entry)
-    save_settings(settings)
     return True
 
 
+def register_hook(spec: HookSpec) -> bool:
+    """
+    Register a hook in settings.local.json.
+
+    Returns True if hook was added, False if already exists.
+    """
+    return register_hooks([spec])[0]
+
+
+def register_hooks(specs: Iterable[HookSpec]) -> list[bool]:
+    """
+    Register several hooks with one settings read and at most one write.
+
+    Returns, per spec, True if it was added, False if it already existed.
+    """
+    settings = load_settings()
+    added = [_add_hook(settings, spec) for spec in specs]
+    if any(added):
+        save_settings(settings)
+    return added
+
+
 def unregister_hook(spec: HookSpec) -> bool:
     """
     Remove a hook from settings.local.json.
@@ -101,35 +174,21 @@ def unregister_hook(spec: HookSpec) -> bool:
     for group in event_hooks:
         group_matcher = group.get("matcher")
         if group_matcher == spec.matcher:
-            # Find and remove the hook
-            original_len = len(group["hooks"])
+            if not any(h.get("command") == spec.command for h in group["hooks"]):
+                continue
+            # Remove the hook (and any duplicates of it)
             group["hooks"] = [
                 h for h in group["hooks"] if h.get("command") != spec.command
             ]
-            if len(group["hooks"]) < original_len:
-                # Clean up empty groups
-                if not group["hooks"]:
-                    event_hooks.remove(group)
-                save_settings(settings)
-                return True
+            # Clean up empty groups
+            if not group["hooks"]:
+                event_hooks.remove(group)
+            save_settings(settings)
+            return True
 
     return False
 
 
 def is_hook_registered(spec: HookSpec) -> bool:
-    """Check if a hook is registered."""
-    settings = load_settings()
-    event_key = spec.event.value
-
-    if "hooks" not in settings:
-        return False
-    if event_key not in settings["hooks"]:
-        return False
-
-    for group in settings["hooks"][event_key]:
-        if group.get("matcher") == spec.matcher:
-            for hook in group["hooks"]:
-                if hook.get("command") == spec.command:
-                    return True
-
-    return False
+    """Check if a hook is registered (cached index of settings.local.json)."""
+    return (spec.event.value, spec.matcher, spec.command) in _registered_hooks()
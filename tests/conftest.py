@@ -0,0 +1,23 @@
+"""
+Shared test helpers.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+HOOKS_DIR = Path(__file__).parent.parent / "src" / "claude_guardrails" / "hooks"
+
+
+def load_hook(name: str) -> ModuleType:
+    """
+    Load a bundled hook script as a module.
+
+    Hooks are standalone scripts with hyphenated names (copied to ~/.claude/hooks
+    and run by the system python3), so they can't be imported from the package.
+    """
+    path = HOOKS_DIR / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
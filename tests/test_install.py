@@ -0,0 +1,226 @@
+"""
+Tests for hook/template installation: fused compare-hash-copy, stat cache, copies.
+"""
+
+import hashlib
+import os
+
+import pytest
+
+pytest.importorskip("rich")
+
+from claude_guardrails.commands import install  # noqa: E402
+from claude_guardrails.types import CopyStatus  # noqa: E402
+
+
+def short_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=3).hexdigest()
+
+
+# =============================================================================
+# _stream_compare_hash_copy
+# =============================================================================
+
+def test_identical_files_are_not_staged(tmp_path):
+    data = os.urandom(3 * install.CHUNK_SIZE + 10)
+    src, dest = tmp_path / "src.py", tmp_path / "dest.py"
+    src.write_bytes(data)
+    dest.write_bytes(data)
+
+    identical, content_hash, staged = install._stream_compare_hash_copy(src, dest, same_size=True)
+
+    assert (identical, content_hash, staged) == (True, short_hash(data), None)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dest.py", "src.py"]
+
+
+@pytest.mark.parametrize("chunk_size", [install.CHUNK_SIZE, 7])
+def test_mismatch_after_first_chunk_stages_whole_source(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(install, "CHUNK_SIZE", chunk_size)  # 7: prefix re-read in many pieces
+    data = os.urandom(3 * install.CHUNK_SIZE + 10)
+    changed = bytearray(data)
+    changed[2 * install.CHUNK_SIZE + 3] ^= 0xFF
+    src, dest = tmp_path / "src.py", tmp_path / "dest.py"
+    src.write_bytes(data)
+    dest.write_bytes(bytes(changed))
+
+    identical, content_hash, staged = install._stream_compare_hash_copy(src, dest, same_size=True)
+
+    assert not identical
+    assert content_hash == short_hash(data)
+    assert staged.parent == tmp_path
+    assert staged.read_bytes() == data
+    assert dest.read_bytes() == bytes(changed)
+
+
+def test_size_mismatch_stages_without_reading_dest(tmp_path):
+    data = os.urandom(install.CHUNK_SIZE + 10)
+    src, dest = tmp_path / "src.py", tmp_path / "dest.py"
+    src.write_bytes(data)
+    dest.write_bytes(b"shorter")
+
+    identical, content_hash, staged = install._stream_compare_hash_copy(src, dest, same_size=False)
+
+    assert not identical
+    assert content_hash == short_hash(data)
+    assert staged.read_bytes() == data
+
+
+# =============================================================================
+# copy_hooks and its stat cache
+# =============================================================================
+
+@pytest.fixture
+def hooks(tmp_path, monkeypatch):
+    """Bundled hooks dir with one hook, empty install dir, cache in tmp_path."""
+    bundled = tmp_path / "bundled"
+    bundled.mkdir()
+    (bundled / "nudge.py").write_bytes(b"print('v1')\n")
+    installed = tmp_path / "hooks"
+    installed.mkdir()
+    monkeypatch.setattr(install, "get_bundled_hooks_dir", lambda: bundled)
+    monkeypatch.setattr(install, "HOOKS_DIR", installed)
+    monkeypatch.setattr(install, "INSTALL_CACHE", tmp_path / "install-cache.json")
+    monkeypatch.setattr(install, "ensure_dirs", lambda: None)
+    return bundled, installed
+
+
+def statuses(results):
+    return [(r.name, r.status) for r in results]
+
+
+def forbid_compare(monkeypatch):
+    """Fail the test if copy_hooks falls back to reading bytes."""
+    def fail(*args, **kwargs):
+        raise AssertionError("expected a cache hit")
+
+    monkeypatch.setattr(install, "_stream_compare_hash_copy", fail)
+
+
+def test_cache_hit_skips_unchanged_hook(hooks, monkeypatch):
+    _, installed = hooks
+    assert statuses(install.copy_hooks()) == [("nudge.py", CopyStatus.COPIED)]
+    assert os.stat(installed / "nudge.py").st_mode & 0o777 == install.HOOK_MODE
+
+    forbid_compare(monkeypatch)
+    assert statuses(install.copy_hooks()) == [("nudge.py", CopyStatus.SKIPPED)]
+
+
+def test_cache_hit_reports_existing_conflict(hooks, monkeypatch):
+    bundled, installed = hooks
+    (installed / "nudge.py").write_bytes(b"print('edited by user')\n")
+
+    [result] = install.copy_hooks()
+    assert result.status == CopyStatus.CONFLICT
+    conflict = installed / f"nudge-{short_hash((bundled / 'nudge.py').read_bytes())}.py"
+    assert result.conflict_path == str(conflict)
+    assert conflict.read_bytes() == (bundled / "nudge.py").read_bytes()
+
+    forbid_compare(monkeypatch)
+    [cached] = install.copy_hooks()
+    assert cached == result
+
+
+def test_cache_invalidated_by_mtime_change(hooks, monkeypatch):
+    _, installed = hooks
+    install.copy_hooks()
+    dest = installed / "nudge.py"
+    st = dest.stat()
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    compared = []
+    real_compare = install._stream_compare_hash_copy
+    monkeypatch.setattr(
+        install, "_stream_compare_hash_copy",
+        lambda *args, **kwargs: compared.append(args) or real_compare(*args, **kwargs),
+    )
+    assert statuses(install.copy_hooks()) == [("nudge.py", CopyStatus.SKIPPED)]
+    assert len(compared) == 1
+
+    assert statuses(install.copy_hooks()) == [("nudge.py", CopyStatus.SKIPPED)]
+    assert len(compared) == 1  # re-cached with the new mtime
+
+
+def test_cache_invalidated_when_conflict_copy_deleted(hooks):
+    _, installed = hooks
+    (installed / "nudge.py").write_bytes(b"print('edited by user')\n")
+    [result] = install.copy_hooks()
+    os.unlink(result.conflict_path)
+
+    [again] = install.copy_hooks()
+    assert again.status == CopyStatus.CONFLICT
+    assert os.path.exists(again.conflict_path)
+
+
+def test_malformed_cache_is_ignored(hooks):
+    install.INSTALL_CACHE.write_text("[]")
+    assert statuses(install.copy_hooks()) == [("nudge.py", CopyStatus.COPIED)]
+
+
+# =============================================================================
+# _fast_copy
+# =============================================================================
+
+def test_fast_copy_falls_back_when_copy_file_range_fails(tmp_path, monkeypatch):
+    if not hasattr(os, "copy_file_range"):
+        pytest.skip("no copy_file_range on this platform")
+    data = os.urandom(install.CHUNK_SIZE + 10)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(data)
+    os.chmod(src, 0o640)
+    dst.write_bytes(b"stale contents that are longer than nothing")
+
+    def unsupported(*args):
+        raise OSError(38, "Function not implemented")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported)
+    install._fast_copy(src, dst)
+
+    assert dst.read_bytes() == data
+    assert os.stat(dst).st_mode & 0o777 == 0o640
+    assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
+
+
+def test_fast_copy_without_copy_file_range(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"data")
+    install._fast_copy(src, dst)
+    assert dst.read_bytes() == b"data"
+
+
+# =============================================================================
+# copy_templates
+# =============================================================================
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    bundled = tmp_path / "templates"
+    bundled.mkdir()
+    (bundled / "reminders.json.example").write_text('{"reminders": []}\n')
+    target = tmp_path / "guardrails"
+    target.mkdir()
+    monkeypatch.setattr(install, "get_bundled_templates_dir", lambda: bundled)
+    monkeypatch.setattr(install, "GUARDRAILS_DIR", target)
+    monkeypatch.setattr(install, "ensure_dirs", lambda: None)
+    return target
+
+
+def test_copy_templates_strips_example_suffix(templates):
+    assert install.copy_templates() == ["reminders.json"]
+    assert (templates / "reminders.json").read_text() == '{"reminders": []}\n'
+
+
+def test_copy_templates_never_overwrites(templates):
+    (templates / "reminders.json").write_text("mine")
+    assert install.copy_templates() == []
+    assert (templates / "reminders.json").read_text() == "mine"
+
+
+def test_copy_templates_removes_placeholder_on_failure(templates, monkeypatch):
+    def broken_copy(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(install, "_fast_copy", broken_copy)
+    with pytest.raises(OSError):
+        install.copy_templates()
+    assert not (templates / "reminders.json").exists()
@@ -0,0 +1,53 @@
+"""
+Tests for claude_guardrails.jsonio atomic writes.
+"""
+
+import os
+import stat
+
+import pytest
+
+from claude_guardrails import jsonio
+
+
+def test_dump_writes_and_skips_unchanged(tmp_path):
+    path = tmp_path / "sub" / "settings.json"
+    assert jsonio.dump({"a": 1}, path) is True
+    assert jsonio.loads(path.read_bytes()) == {"a": 1}
+    mtime = path.stat().st_mtime_ns
+    assert jsonio.dump({"a": 1}, path) is False
+    assert path.stat().st_mtime_ns == mtime
+    assert [p.name for p in path.parent.iterdir()] == ["settings.json"]
+
+
+def test_dump_keeps_existing_mode(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{}")
+    path.chmod(0o600)
+    jsonio.dump({"env": {"TOKEN": "secret"}}, path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_dump_writes_through_symlink(tmp_path):
+    target = tmp_path / "dotfiles" / "settings.json"
+    target.parent.mkdir()
+    target.write_text("{}")
+    target.chmod(0o600)
+    link = tmp_path / "settings.json"
+    link.symlink_to(target)
+
+    jsonio.dump({"a": 1}, link)
+
+    assert link.is_symlink()
+    assert os.readlink(link) == str(target)
+    assert jsonio.loads(target.read_bytes()) == {"a": 1}
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_dumps_same_bytes_with_and_without_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    obj = {"message": "✓ café 😀", "n": [1, 2.5, None, True], "empty": {}, "s": 'a"b\\c\n\x01'}
+    with_orjson = jsonio.dumps(obj)
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.dumps(obj) == with_orjson
+    assert "✓".encode() in with_orjson
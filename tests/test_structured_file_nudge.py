@@ -0,0 +1,45 @@
+"""
+Tests for the structured file nudge hook's pure formatting and line counting.
+"""
+
+import os
+
+from conftest import load_hook
+
+hook = load_hook("structured-file-nudge")
+
+
+def message(line_count: int, capped: bool = False) -> str:
+    file_info = hook.FileInfo(
+        path="a.json", extension=".json", line_count=line_count, line_count_capped=capped
+    )
+    return hook.format_nudge_message(file_info, hook.determine_nudge_level(line_count))
+
+
+def test_gentle_nudge_shows_exact_count():
+    assert message(120).startswith("Note: a.json is 120 lines")
+
+
+def test_exact_count_is_shown_as_is():
+    assert message(900).startswith("Heads up: a.json is 900 lines")
+
+
+def test_capped_count_is_shown_as_lower_bound():
+    assert message(hook.MEDIUM_FILE_THRESHOLD, capped=True).startswith(
+        "Heads up: a.json is 250+ lines"
+    )
+
+
+def test_line_count_stops_at_limit(tmp_path):
+    path = tmp_path / "big.json"
+    path.write_bytes(b"{}\n" * 1000)
+    assert hook.get_line_count(str(path), 250) == 250
+    assert hook.get_line_count(str(path), 5000) == 1000
+    assert hook.get_line_count(str(tmp_path / "missing.json"), 250) is None
+
+
+def test_line_count_skips_non_regular_files(tmp_path):
+    fifo = tmp_path / "pipe.json"
+    os.mkfifo(fifo)
+    assert hook.get_line_count(str(fifo), 250) is None  # returns at once, no writer needed
+    assert hook.get_line_count(str(tmp_path), 250) is None
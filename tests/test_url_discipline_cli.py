@@ -0,0 +1,50 @@
+"""
+Tests for the url-discipline allowlist commands.
+"""
+
+import json
+
+import pytest
+
+typer = pytest.importorskip("typer")
+
+from claude_guardrails.commands import url_discipline  # noqa: E402
+
+
+@pytest.fixture
+def allowlist_path(tmp_path, monkeypatch):
+    path = tmp_path / "url-allowlist.json"
+    monkeypatch.setattr(url_discipline, "URL_ALLOWLIST", path)
+    return path
+
+
+@pytest.mark.parametrize("content, expected", [
+    ({"patterns": ["docs.python.org", 1, None]}, ["docs.python.org"]),
+    ({"patterns": "docs.python.org"}, []),
+    (["docs.python.org"], []),
+    (None, []),
+])
+def test_load_allowlist_matches_hook_reading(allowlist_path, content, expected):
+    allowlist_path.write_text(json.dumps(content))
+    assert url_discipline.load_allowlist() == expected
+
+
+def test_load_allowlist_missing_or_malformed(allowlist_path):
+    assert url_discipline.load_allowlist() == []
+    allowlist_path.write_text("{not json")
+    assert url_discipline.load_allowlist() == []
+
+
+@pytest.mark.parametrize("pattern", ["", "*.", "*./en/*", "/docs/*", "https://docs.python.org"])
+def test_allow_rejects_patterns_without_a_usable_host(allowlist_path, pattern):
+    with pytest.raises(typer.Exit):
+        url_discipline.allow(pattern)
+    assert not allowlist_path.exists()
+
+
+def test_allow_and_deny(allowlist_path):
+    url_discipline.allow("*.readthedocs.io/en/*")
+    url_discipline.allow("*.readthedocs.io/en/*")
+    assert url_discipline.load_allowlist() == ["*.readthedocs.io/en/*"]
+    url_discipline.deny("*.readthedocs.io/en/*")
+    assert url_discipline.load_allowlist() == []
@@ -0,0 +1,144 @@
+"""
+Tests for the WebFetch URL discipline hook's allowlist matcher.
+"""
+
+import json
+
+import pytest
+
+from conftest import load_hook
+
+hook = load_hook("webfetch-url-discipline")
+
+
+def allowed(url: str, *patterns: str) -> bool:
+    return hook.is_allowlisted(hook.parse_url(url), hook.build_url_pattern_set(list(patterns)))
+
+
+# =============================================================================
+# parse_url
+# =============================================================================
+
+@pytest.mark.parametrize("url, host, path", [
+    ("https://docs.python.org/3/library/", "docs.python.org", "/3/library/"),
+    ("https://ex.com", "ex.com", ""),
+    ("https://ex.com/?q=1#frag", "ex.com", "/"),
+    ("https://ex.com#frag", "ex.com", ""),
+    ("ex.com/a", "ex.com", "/a"),
+    ("https://evil.com\\@docs.python.org/x", "evil.com", "/@docs.python.org/x"),
+])
+def test_parse_url(url, host, path):
+    url_info = hook.parse_url(url)
+    assert (url_info.host, url_info.path) == (host, path)
+
+
+# =============================================================================
+# is_allowlisted
+# =============================================================================
+
+def test_exact_host():
+    assert allowed("https://docs.python.org/3/library/os.html", "docs.python.org")
+    assert allowed("https://DOCS.Python.org/3/", "docs.python.org")
+    assert not allowed("https://python.org/3/", "docs.python.org")
+    assert not allowed("https://sub.docs.python.org/3/", "docs.python.org")
+
+
+def test_subdomain_wildcard():
+    assert allowed("https://foo.readthedocs.io/en/x", "*.readthedocs.io")
+    assert allowed("https://a.b.readthedocs.io/x", "*.readthedocs.io")
+    assert not allowed("https://readthedocs.io/x", "*.readthedocs.io")
+    assert not allowed("https://evilreadthedocs.io/x", "*.readthedocs.io")
+
+
+def test_any_host():
+    assert allowed("https://anything.example/x/y", "*")
+    assert allowed("https://anything.example/api/v1", "*/api/*")
+    assert not allowed("https://anything.example/docs/v1", "*/api/*")
+
+
+def test_path_glob():
+    assert allowed("https://github.com/m-gris/repo", "github.com/m-gris/*")
+    assert not allowed("https://github.com/other/repo", "github.com/m-gris/*")
+    assert not allowed("https://github.com/", "github.com/m-gris/*")
+
+
+def test_path_glob_star_matches_across_slashes():
+    assert allowed("https://docs.python.org/3/library/os.html", "docs.python.org/3/*")
+
+
+@pytest.mark.parametrize("url, pattern", [
+    ("https://github.com/m-gris/../evil/x", "github.com/m-gris/*"),
+    ("https://github.com/m-gris/%2e%2e/evil/x", "github.com/m-gris/*"),
+    ("https://github.com/m-gris/%2E./evil/x", "github.com/m-gris/*"),
+    ("https://github.com/m-gris/a/../../evil/x", "github.com/m-gris/*"),
+    ("https://github.com/m-gris\\..\\evil/x", "github.com/m-gris/*"),
+    ("https://docs.python.org/3/../2/x", "docs.python.org/3/*"),
+])
+def test_dot_segments_do_not_escape_path_glob(url, pattern):
+    assert not allowed(url, pattern)
+
+
+def test_dot_segments_inside_the_glob_still_match():
+    assert allowed("https://github.com/m-gris/a/../repo", "github.com/m-gris/*")
+    assert allowed("https://github.com/m-gris/./repo", "github.com/m-gris/*")
+
+
+@pytest.mark.parametrize("path, resolved", [
+    ("", ""),
+    ("/", "/"),
+    ("/a/b", "/a/b"),
+    ("/a/./b", "/a/b"),
+    ("/a/../b", "/b"),
+    ("/../../b", "/b"),
+    ("/a/b/..", "/a/"),
+    ("/a/.", "/a/"),
+    ("/a/%2E%2e/b", "/b"),
+    ("/a/...", "/a/..."),
+])
+def test_resolve_dot_segments(path, resolved):
+    assert hook.resolve_dot_segments(path) == resolved
+
+
+def test_userinfo_and_port_are_ignored():
+    assert allowed("https://user:pw@docs.python.org:443/3/", "docs.python.org")
+    assert not allowed("https://docs.python.org@evil.com/3/", "docs.python.org")
+
+
+def test_backslash_does_not_spoof_host():
+    assert not allowed("https://evil.com\\@docs.python.org/x", "docs.python.org")
+    assert allowed("https://evil.com\\@docs.python.org/x", "evil.com")
+
+
+def test_backslash_in_host_is_never_allowlisted():
+    url_info = hook.UrlInfo(full_url="", host="evil.com\\@docs.python.org", path="/x")
+    assert not hook.is_allowlisted(url_info, hook.build_url_pattern_set(["*"]))
+
+
+def test_empty_allowlist():
+    assert not allowed("https://docs.python.org/3/")
+
+
+# =============================================================================
+# read_allowlist
+# =============================================================================
+
+@pytest.mark.parametrize("content, expected", [
+    ({"patterns": ["docs.python.org", 1, None, "*.rtd.io"]}, ["docs.python.org", "*.rtd.io"]),
+    ({"patterns": "docs.python.org"}, []),
+    ({"patterns": 1}, []),
+    (["docs.python.org"], []),
+    ({}, []),
+])
+def test_read_allowlist_keeps_only_strings(tmp_path, monkeypatch, content, expected):
+    path = tmp_path / "url-allowlist.json"
+    path.write_text(json.dumps(content))
+    monkeypatch.setattr(hook, "ALLOWLIST_PATH", str(path))
+    assert hook.read_allowlist() == expected
+
+
+def test_read_allowlist_missing_or_malformed(tmp_path, monkeypatch):
+    path = tmp_path / "url-allowlist.json"
+    monkeypatch.setattr(hook, "ALLOWLIST_PATH", str(path))
+    assert hook.read_allowlist() == []
+    path.write_text("{not json")
+    assert hook.read_allowlist() == []